@@ -24,9 +24,9 @@ Note:
 - Sv = the volume backscattering strength
 
 """
-import echopype as ep
 import numpy as np
 import xarray as xr
+from echopype.clean import remove_background_noise
 
 
 def apply_remove_background_noise(
@@ -75,18 +75,17 @@ def apply_remove_background_noise(
 
     # Compute range_sample_num if not provided
     if range_sample_num is None:
-        range_sample_nums = []
-        for ch in range(ds_Sv.sizes["channel"]):
-            mean_diff = np.nanmean(np.diff(ds_Sv["echo_range"].isel(channel=ch).values[0, :]))
-            if np.isnan(mean_diff):
-                raise ValueError(
-                    "The default computed value for the range_sample_num is nan, please add the range_sample_num as input parameter"
-                )
-            range_sample_nums.append(int(10 / mean_diff))
-
-        range_sample_num = min(range_sample_nums)
+        # Mean sample spacing of the first ping, one value per channel; only this
+        # reduced result is loaded when echo_range is dask-backed
+        echo_range = ds_Sv["echo_range"].isel(ping_time=0)
+        mean_diff = echo_range.diff("range_sample").mean("range_sample", skipna=True).values
+        if np.isnan(mean_diff).any():
+            raise ValueError(
+                "The default computed value for the range_sample_num is nan, please add the range_sample_num as input parameter"
+            )
+        range_sample_num = int(np.min(10 / mean_diff))
     # Remove noise
-    ds_Sv_processed = ep.clean.remove_background_noise(
+    ds_Sv_processed = remove_background_noise(
         ds_Sv,
         ping_num=ping_num,
         range_sample_num=range_sample_num,
@@ -59,20 +59,23 @@ def enrich_sv_dataset(sv: xr.Dataset, echodata: EchoData, **kwargs) -> xr.Datase
     ]
     splitbeam_args = {k: kwargs[k] for k in splitbeam_keys if k in kwargs}
 
-    try:
-        add_depth(sv, **depth_args)
-    except Exception as e:
-        warnings.warn(f"Failed to add depth due to error: {str(e)}")
+    if "echo_range" not in sv:
+        warnings.warn("Failed to add depth: echo_range is missing from the Sv dataset", stacklevel=2)
+    else:
+        try:
+            add_depth(sv, **depth_args)
+        except Exception as e:
+            warnings.warn(f"Failed to add depth due to error: {str(e)}", stacklevel=2)
 
     try:
         sv = add_location(sv, echodata, **location_args)
     except Exception as e:
-        warnings.warn(f"Failed to add location due to error: {str(e)}")
+        warnings.warn(f"Failed to add location due to error: {str(e)}", stacklevel=2)
 
     try:
         add_splitbeam_angle(sv, echodata, **splitbeam_args)
     except Exception as e:
-        warnings.warn(f"Failed to add split-beam angle due to error: {str(e)}")
+        warnings.warn(f"Failed to add split-beam angle due to error: {str(e)}", stacklevel=2)
 
     return sv
 
@@ -89,16 +92,15 @@ def add_depth(Sv: xr.Dataset, depth_offset: float = 0, tilt: float = 0, downward
     - downward (bool): Flag indicating whether the depth is measured downward (True) or upward (False).
     """
 
-    mult = 1 if downward else -1
-
-    first_channel = Sv["channel"].values[0]
-    first_ping_time = Sv["ping_time"].values[0]
-
-    # Slice the echo_range to get the desired range of values
-    selected_echo_range = Sv["echo_range"].sel(channel=first_channel, ping_time=first_ping_time)
-    selected_echo_range = selected_echo_range.values.tolist()
-    selected_echo_range = [mult * value * np.cos(tilt / 180 * np.pi) + depth_offset for value in selected_echo_range]
-    Sv = Sv.assign_coords(range_sample=selected_echo_range)
+    # Slice the echo_range of the first channel and ping to get the desired range of values
+    selected_echo_range = Sv["echo_range"].isel(channel=0, ping_time=0)
+    # With a downward-facing, untilted transducer and no offset, depth is echo_range itself
+    if tilt != 0 or depth_offset != 0 or not downward:
+        factor = (1.0 if downward else -1.0) * np.cos(np.deg2rad(tilt))
+        selected_echo_range = selected_echo_range * factor + depth_offset
+    # Only the selected row is loaded; range_sample is an index coordinate and must be in memory
+    selected_echo_range = selected_echo_range.to_numpy()
+    Sv = Sv.assign_coords(range_sample=("range_sample", selected_echo_range))
     min_val = np.nanmin(selected_echo_range)
     max_val = np.nanmax(selected_echo_range)
     Sv = Sv.sel(range_sample=slice(min_val, max_val))
@@ -119,7 +121,17 @@ def add_seabed_depth(Sv: xr.Dataset):
     xr.Dataset:
         An enhanced dataset with seabed depth
     """
-    seabed_mask = ~Sv["mask_seabed"]
-    seabed_level = seabed_mask.argmax(dim="range_sample")
+    seabed_mask = Sv["mask_seabed"]
+    # The first False sample along range_sample is the first minimum of the boolean mask,
+    # so argmin finds it without allocating an inverted copy of the mask
+    seabed_level = xr.DataArray(
+        np.argmin(seabed_mask.data, axis=seabed_mask.get_axis_num("range_sample")),
+        dims=[dim for dim in seabed_mask.dims if dim != "range_sample"],
+        coords={
+            name: coord
+            for name, coord in seabed_mask.coords.items()
+            if "range_sample" not in coord.dims
+        },
+    )
     res = Sv.assign(seabed_level=seabed_level)
     return res
@@ -64,7 +64,7 @@ def plot_individual_channel(ds_Sv, channel, output_path, file_base_name,
         ax.axhline(depth, color='gray', linestyle='--', linewidth=0.5)
 
     # Convert the first ping_time to a Python datetime object
-    date_str = pd.to_datetime(ds_Sv.ping_time.values[0]).strftime('%Y-%m-%d')
+    date_str = pd.to_datetime(ds_Sv.ping_time[0].values).strftime('%Y-%m-%d')
 
     # Add date label on the right side
     plt.xlabel('Time (HH:MM)', fontsize=14)
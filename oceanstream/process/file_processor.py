@@ -56,17 +56,17 @@ def compute_and_export_single_file(config_data, **kwargs):
 
         output_message = {
             "filename": str(output_path),  # Convert PosixPath to string
-            "file_npings": len(ds_processed["ping_time"].values),
-            "file_nsamples": len(ds_processed["range_sample"].values),
-            "file_start_time": str(ds_processed["ping_time"].values[0]),
-            "file_end_time": str(ds_processed["ping_time"].values[-1]),
+            "file_npings": ds_processed.sizes["ping_time"],
+            "file_nsamples": ds_processed.sizes["range_sample"],
+            "file_start_time": str(ds_processed["ping_time"][0].values),
+            "file_end_time": str(ds_processed["ping_time"][-1].values),
             "file_freqs": ",".join(map(str, ds_processed["frequency_nominal"].values)),
-            "file_start_depth": str(ds_processed["range_sample"].values[0]),
-            "file_end_depth": str(ds_processed["range_sample"].values[-1]),
-            "file_start_lat": echodata["Platform"]["latitude"].values[0],
-            "file_start_lon": echodata["Platform"]["longitude"].values[0],
-            "file_end_lat": echodata["Platform"]["latitude"].values[-1],
-            "file_end_lon": echodata["Platform"]["longitude"].values[-1],
+            "file_start_depth": str(ds_processed["range_sample"][0].values),
+            "file_end_depth": str(ds_processed["range_sample"][-1].values),
+            "file_start_lat": echodata["Platform"]["latitude"][0].item(),
+            "file_start_lon": echodata["Platform"]["longitude"][0].item(),
+            "file_end_lat": echodata["Platform"]["latitude"][-1].item(),
+            "file_end_lon": echodata["Platform"]["longitude"][-1].item(),
             "echogram_files": echogram_files
         }
         file_data.append(output_message)
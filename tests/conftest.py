@@ -1,5 +1,6 @@
 import ftplib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from ftplib import FTP
 from pathlib import Path
 
@@ -19,6 +20,15 @@ current_directory = os.path.dirname(os.path.abspath(__file__))
 TEST_DATA_FOLDER = os.path.join(current_directory, "..", "test_data")
 FTP_MAIN = "ftp.bas.ac.uk"
 FTP_PARTIAL_PATH = "rapidkrill/ek60/"
+FTP_MAX_CONNECTIONS = 4
+
+
+def download_ftp_item(remote_path, local_path):
+    # ftplib connections are not thread-safe, so every download opens its own
+    with FTP(FTP_MAIN) as ftp:
+        ftp.login()
+        with open(local_path, "wb") as local_file:
+            ftp.retrbinary("RETR " + remote_path, local_file.write)
 
 
 def download_ftp_directory(ftp, remote_path, local_path):
@@ -26,17 +36,19 @@ def download_ftp_directory(ftp, remote_path, local_path):
         os.makedirs(local_path, exist_ok=True)
         items = ftp.nlst(remote_path)
 
+        pending = []
         for item in items:
             local_item_path = os.path.join(local_path, os.path.basename(item))
             if is_directory(ftp, item):
                 download_ftp_directory(ftp, item, local_item_path)
-            else:
-                # Check if the file already exists locally
-                if not os.path.exists(local_item_path):
-                    with open(local_item_path, "wb") as local_file:
-                        ftp.retrbinary("RETR " + item, local_file.write)
-                else:
-                    continue
+            elif not os.path.exists(local_item_path):
+                # Only download files that don't already exist locally
+                pending.append((item, local_item_path))
+
+        with ThreadPoolExecutor(max_workers=FTP_MAX_CONNECTIONS) as executor:
+            futures = [executor.submit(download_ftp_item, item, path) for item, path in pending]
+            for future in futures:
+                future.result()
 
     except Exception as e:
         print(f"Error downloading {remote_path}. Error: {e}")
@@ -21,9 +21,8 @@ def shoal_masks(ek_60_Sv_denoised):
 
 
 @pytest.mark.ignore
-def test_create_shoal_mask_multichannel(ek_60_Sv_denoised):
-    mask = create_shoal_mask_multichannel(ek_60_Sv_denoised)
-    assert _count_false_values(mask) == 4471604
+def test_create_shoal_mask_multichannel(shoal_masks):
+    assert _count_false_values(shoal_masks) == 4471604
 
 
 @pytest.mark.ignore
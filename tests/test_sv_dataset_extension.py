@@ -13,28 +13,28 @@ from oceanstream.denoise.noise_masks import (
 from oceanstream.utils import add_metadata_to_mask, dict_to_formatted_list
 
 
-def test_enrich_sv_dataset_depth_mean(ed_ek_60_for_Sv):
+@pytest.fixture(scope="module")
+def enriched_sv_depth_offset(ed_ek_60_for_Sv):
     sv_echopype_EK60 = compute_sv(ed_ek_60_for_Sv)
     enriched_sv = enrich_sv_dataset(
         sv_echopype_EK60, ed_ek_60_for_Sv, depth_offset=200, waveform_mode="CW", encode_mode="power"
     )
+    return enriched_sv
+
+
+def test_enrich_sv_dataset_depth_mean(enriched_sv_depth_offset):
+    enriched_sv = enriched_sv_depth_offset
     assert np.nanmean(enriched_sv.depth.values) == pytest.approx(299.87710562283445, 0.0001)
 
 
-def test_enhance_sv_location_mean(ed_ek_60_for_Sv):
-    sv_echopype_EK60 = compute_sv(ed_ek_60_for_Sv)
-    enriched_sv = enrich_sv_dataset(
-        sv_echopype_EK60, ed_ek_60_for_Sv, depth_offset=200, waveform_mode="CW", encode_mode="power"
-    )
+def test_enhance_sv_location_mean(enriched_sv_depth_offset):
+    enriched_sv = enriched_sv_depth_offset
     assert np.nanmean(enriched_sv.latitude.values) == pytest.approx(44.705425101593775, 0.0001)
     assert np.nanmean(enriched_sv.longitude.values) == pytest.approx(-124.34924860021844, 0.0001)
 
 
-def test_enrich_sv_dataset_splitbeam_angle_max(ed_ek_60_for_Sv):
-    sv_echopype_EK60 = compute_sv(ed_ek_60_for_Sv)
-    enriched_sv = enrich_sv_dataset(
-        sv_echopype_EK60, ed_ek_60_for_Sv, depth_offset=200, waveform_mode="CW", encode_mode="power"
-    )
+def test_enrich_sv_dataset_splitbeam_angle_max(enriched_sv_depth_offset):
+    enriched_sv = enriched_sv_depth_offset
     assert np.nanmax(enriched_sv.angle_alongship.values) == pytest.approx(
         13.057721067462003, 0.0001
     )
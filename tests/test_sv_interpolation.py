@@ -39,6 +39,12 @@ sample_dataset_with_mask = sample_dataset.copy()
 sample_dataset_with_mask["mask_transient"] = sample_mask
 
 
+@pytest.fixture(scope="module")
+def impulse_mask_jr179(complete_dataset_jr179):
+    mask = create_impulse_mask(complete_dataset_jr179, parameters=RYAN_DEFAULT_PARAMS)
+    return add_metadata_to_mask(mask, {"mask_type": "impulse"})
+
+
 def test_db_to_linear():
     expected_output = xr.DataArray([10 ** (10 / 10), 10 ** (20 / 10), 10 ** (30 / 10)], dims="x")
     assert db_to_linear(sample_db_data).equals(expected_output)
@@ -51,24 +57,18 @@ def test_linear_to_db():
     assert linear_to_db(sample_linear_data).equals(expected_output)
 
 
-def test_interpolate_sv_with_dataset_input(complete_dataset_jr179):
-    metadata = {"mask_type": "impulse"}
+def test_interpolate_sv_with_dataset_input(complete_dataset_jr179, impulse_mask_jr179):
     source_sv = complete_dataset_jr179
-    mask = create_impulse_mask(source_sv, parameters=RYAN_DEFAULT_PARAMS)
-    mask_with_metadata = add_metadata_to_mask(mask, metadata)
-    dataset_with_mask = attach_mask_to_dataset(source_sv, mask_with_metadata)
+    dataset_with_mask = attach_mask_to_dataset(source_sv, impulse_mask_jr179)
     interpolated_dataset = interpolate_sv(dataset_with_mask)
     assert isinstance(interpolated_dataset, xr.Dataset)
     assert "Sv_interpolated" in interpolated_dataset.data_vars
 
 
-def test_interpolate_sv_with_nc_path_input(complete_dataset_jr179):
+def test_interpolate_sv_with_nc_path_input(complete_dataset_jr179, impulse_mask_jr179):
     # Assuming a sample netCDF file named "sample.nc" exists in the current directory
-    metadata = {"mask_type": "impulse"}
     source_sv = complete_dataset_jr179
-    mask = create_impulse_mask(source_sv, parameters=RYAN_DEFAULT_PARAMS)
-    mask_with_metadata = add_metadata_to_mask(mask, metadata)
-    dataset_with_mask = attach_mask_to_dataset(source_sv, mask_with_metadata)
+    dataset_with_mask = attach_mask_to_dataset(source_sv, impulse_mask_jr179)
     write_processed(dataset_with_mask, file_path=TEST_DATA_FOLDER, file_name="sample.nc")
     saved_file_path = Path(TEST_DATA_FOLDER, "sample.nc")
     interpolated_dataset = interpolate_sv(saved_file_path)
@@ -76,14 +76,11 @@ def test_interpolate_sv_with_nc_path_input(complete_dataset_jr179):
     assert "Sv_interpolated" in interpolated_dataset.data_vars
 
 
-def test_interpolate_sv_with_zarr_path_input(complete_dataset_jr179):
+def test_interpolate_sv_with_zarr_path_input(complete_dataset_jr179, impulse_mask_jr179):
     # Assuming a sample zarr directory named "sample.zarr" exists in the current directory
     # Assuming a sample netCDF file named "sample.nc" exists in the current directory
-    metadata = {"mask_type": "impulse"}
     source_sv = complete_dataset_jr179
-    mask = create_impulse_mask(source_sv, parameters=RYAN_DEFAULT_PARAMS)
-    mask_with_metadata = add_metadata_to_mask(mask, metadata)
-    dataset_with_mask = attach_mask_to_dataset(source_sv, mask_with_metadata)
+    dataset_with_mask = attach_mask_to_dataset(source_sv, impulse_mask_jr179)
     write_processed(dataset_with_mask, file_path=TEST_DATA_FOLDER, file_name="sample.zarr")
     saved_file_path = Path(TEST_DATA_FOLDER, "sample.zarr")
     interpolated_dataset = interpolate_sv(saved_file_path)
@@ -149,12 +146,9 @@ def test_missing_sv_or_channel():
         interpolate_sv(missing_channel_dataset)
 
 
-def test_retains_metadata_and_other_dataarrays(complete_dataset_jr179):
-    metadata = {"mask_type": "impulse"}
+def test_retains_metadata_and_other_dataarrays(complete_dataset_jr179, impulse_mask_jr179):
     source_sv = complete_dataset_jr179
-    mask = create_impulse_mask(source_sv, parameters=RYAN_DEFAULT_PARAMS)
-    mask_with_metadata = add_metadata_to_mask(mask, metadata)
-    dataset_with_mask = attach_mask_to_dataset(source_sv, mask_with_metadata)
+    dataset_with_mask = attach_mask_to_dataset(source_sv, impulse_mask_jr179)
 
     result = interpolate_sv(dataset_with_mask)
 
@@ -171,13 +165,10 @@ def test_retains_metadata_and_other_dataarrays(complete_dataset_jr179):
             assert np.array_equal(dataset_with_mask[data_var], result[data_var])
 
 
-def test_deterministic_behavior(complete_dataset_jr179):
-    metadata = {"mask_type": "impulse"}
+def test_deterministic_behavior(complete_dataset_jr179, impulse_mask_jr179):
     source_sv = complete_dataset_jr179
-    mask = create_impulse_mask(source_sv, parameters=RYAN_DEFAULT_PARAMS)
-    mask_with_metadata = add_metadata_to_mask(mask, metadata)
-    dataset_with_mask1 = attach_mask_to_dataset(source_sv, mask_with_metadata)
-    dataset_with_mask2 = dataset_with_mask1.copy(deep=True)
+    dataset_with_mask1 = attach_mask_to_dataset(source_sv, impulse_mask_jr179)
+    dataset_with_mask2 = dataset_with_mask1.copy(deep=False)
     # print(np.isnan(dataset_with_mask1["Sv"]).sum())
     # print(np.isnan(dataset_with_mask2["Sv"]).sum())
     assert np.allclose(